@@ -8,69 +8,164 @@ conflict detection, and dry-run mode.
 
 import json
 import argparse
+import os
+import re
 import sys
+from collections import Counter, defaultdict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from operator import attrgetter
 from pathlib import Path
 from typing import Dict, List, Set, Tuple
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:  # stdlib fallback; orjson is optional
+    orjson = None
+
+
+def _read_json(path) -> dict:
+    """Read and parse a JSON file, using orjson when available."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def _write_json(path, data: dict):
+    """Write data as 2-space indented, ASCII-escaped JSON (the data files' on-disk format)."""
+    # orjson cannot escape non-ASCII, so writes stay on the stdlib encoder
+    with open(path, 'w') as f:
+        json.dump(data, f, indent=2)
+
+
+# Top-level "last_updated" line as written with 2-space indentation
+_LAST_UPDATED_RE = re.compile(rb'^  "last_updated": "([^"]*)"', re.MULTILINE)
+
+# Lightweight row returned by DataManager.list_models for CLI display
+ModelSummary = namedtuple(
+    'ModelSummary',
+    'id name provider family parameters_billions active_parameters_billions file'
+)
+
+
+def _json_files_in(directory: Path) -> List[Path]:
+    """List the .json files directly inside a directory."""
+    with os.scandir(directory) as entries:
+        return [
+            Path(entry.path) for entry in entries
+            if entry.name.endswith('.json') and entry.is_file()
+        ]
+
+
+# Below this many files, thread start-up costs more than overlapping the reads saves
+_PARALLEL_READ_THRESHOLD = 500
+
+
+def _read_json_files(paths: List[Path], max_workers: int = 8) -> List[dict]:
+    """Read several JSON files, returning results in input order."""
+    if len(paths) <= _PARALLEL_READ_THRESHOLD:
+        return [_read_json(path) for path in paths]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+        return list(executor.map(_read_json, paths))
+
 
 class DataManager:
     def __init__(self, data_dir: Path):
         self.data_dir = data_dir
         self.models_dir = data_dir / 'models'
         self.benchmarks_dir = data_dir / 'benchmarks'
+        # Lazily populated by the loaders; reset by _invalidate_caches()
+        self._benchmarks_cache = None
+        self._models_cache = None
+        # bench_id -> category files it appears in, built with _benchmarks_cache
+        self._benchmark_sources = None
+        # model_id -> (file path relative to data_dir, model dict), built with _models_cache
+        self._model_index = None
+
+    def _invalidate_caches(self):
+        """Drop cached loader results after a write to the data files."""
+        self._benchmarks_cache = None
+        self._models_cache = None
+        self._benchmark_sources = None
+        self._model_index = None
 
     def load_all_benchmarks(self) -> Dict[str, dict]:
         """Load all benchmarks from category files."""
+        if self._benchmarks_cache is not None:
+            return self._benchmarks_cache
+
+        category_files = [
+            path for path in _json_files_in(self.benchmarks_dir)
+            if path.name != 'categories.json'
+        ]
+
         all_benchmarks = {}
-        for category_file in self.benchmarks_dir.glob('*.json'):
-            if category_file.name == 'categories.json':
-                continue
-            with open(category_file) as f:
-                data = json.load(f)
-                all_benchmarks.update(data.get('benchmarks', {}))
+        benchmark_sources = defaultdict(list)
+        for category_file, data in zip(category_files, _read_json_files(category_files)):
+            benchmarks = data.get('benchmarks', {})
+            all_benchmarks.update(benchmarks)
+            for bench_id in benchmarks:
+                benchmark_sources[bench_id].append(category_file.name)
+        self._benchmarks_cache = all_benchmarks
+        self._benchmark_sources = benchmark_sources
         return all_benchmarks
 
     def load_all_models(self) -> Dict[str, List[dict]]:
         """Load all models grouped by file."""
-        models_by_file = {}
-        for provider_dir in self.models_dir.iterdir():
-            if provider_dir.is_file() and provider_dir.suffix == '.json':
-                # Top-level provider files (google.json, meta.json)
-                with open(provider_dir) as f:
-                    data = json.load(f)
-                    models_by_file[str(provider_dir.relative_to(self.data_dir))] = data
-            elif provider_dir.is_dir():
-                # Provider subdirectories (openai/, anthropic/, qwen/)
-                for model_file in provider_dir.glob('*.json'):
-                    with open(model_file) as f:
-                        data = json.load(f)
-                        models_by_file[str(model_file.relative_to(self.data_dir))] = data
+        if self._models_cache is not None:
+            return self._models_cache
+
+        model_files = []
+        with os.scandir(self.models_dir) as entries:
+            for entry in entries:
+                if entry.is_file() and entry.name.endswith('.json'):
+                    # Top-level provider files (google.json, meta.json)
+                    model_files.append(Path(entry.path))
+                elif entry.is_dir():
+                    # Provider subdirectories (openai/, anthropic/, qwen/)
+                    model_files.extend(_json_files_in(Path(entry.path)))
+
+        models_by_file = {
+            str(model_file.relative_to(self.data_dir)): data
+            for model_file, data in zip(model_files, _read_json_files(model_files))
+        }
+
+        # Index model IDs for constant-time lookups (first occurrence wins)
+        model_index = {}
+        for file_path, data in models_by_file.items():
+            for model in data.get('models', []):
+                model_index.setdefault(model['id'], (file_path, model))
+
+        self._models_cache = models_by_file
+        self._model_index = model_index
         return models_by_file
 
+    def _lookup_model(self, model_id: str) -> Tuple[str, dict]:
+        """Return (relative file path, model dict) for a model ID via the index."""
+        self.load_all_models()
+        return self._model_index.get(model_id, (None, None))
+
     def find_model_file(self, model_id: str) -> Tuple[Path, dict]:
         """Find which file contains a model by ID."""
-        models_by_file = self.load_all_models()
-        for file_path, data in models_by_file.items():
-            for model in data.get('models', []):
-                if model['id'] == model_id:
-                    return self.data_dir / file_path, data
-        return None, None
+        file_path, _ = self._lookup_model(model_id)
+        if file_path is None:
+            return None, None
+        return self.data_dir / file_path, self.load_all_models()[file_path]
 
     def query_model(self, model_id: str) -> dict:
         """Query a model by ID and return its data."""
-        models_by_file = self.load_all_models()
-        for file_path, data in models_by_file.items():
-            for model in data.get('models', []):
-                if model['id'] == model_id:
-                    return {
-                        'model': model,
-                        'file': file_path,
-                        'provider': data.get('provider', 'Unknown')
-                    }
-        return None
-
-    def list_models(self, provider: str = None, family: str = None) -> List[dict]:
+        file_path, model = self._lookup_model(model_id)
+        if file_path is None:
+            return None
+        return {
+            'model': model,
+            'file': file_path,
+            'provider': self.load_all_models()[file_path].get('provider', 'Unknown')
+        }
+
+    def list_models(self, provider: str = None, family: str = None) -> List[ModelSummary]:
         """List all models, optionally filtered by provider or family."""
         models_by_file = self.load_all_models()
         all_models = []
@@ -80,21 +175,23 @@ class DataManager:
                     continue
                 if family and model.get('family') != family:
                     continue
-                all_models.append({
-                    'id': model['id'],
-                    'name': model['name'],
-                    'provider': model.get('provider', 'Unknown'),
-                    'family': model.get('family', 'Unknown'),
-                    'parameters_billions': model.get('parameters_billions'),
-                    'active_parameters_billions': model.get('active_parameters_billions'),
-                    'file': file_path
-                })
-        return sorted(all_models, key=lambda x: (x['provider'], x['family'], x['id']))
-
-    def validate_benchmarks_exist(self, benchmark_ids: Set[str]) -> Tuple[bool, List[str]]:
-        """Check if all benchmark IDs exist in benchmark files."""
-        all_benchmarks = self.load_all_benchmarks()
-        missing = [bid for bid in benchmark_ids if bid not in all_benchmarks]
+                all_models.append(ModelSummary(
+                    id=model['id'],
+                    name=model['name'],
+                    provider=model.get('provider', 'Unknown'),
+                    family=model.get('family', 'Unknown'),
+                    parameters_billions=model.get('parameters_billions'),
+                    active_parameters_billions=model.get('active_parameters_billions'),
+                    file=file_path
+                ))
+        return sorted(all_models, key=attrgetter('provider', 'family', 'id'))
+
+    def validate_benchmarks_exist(self, benchmark_ids: Set[str],
+                                  known_benchmarks: Set[str] = None) -> Tuple[bool, List[str]]:
+        """Check if all benchmark IDs exist in benchmark files (or the given known set)."""
+        if known_benchmarks is None:
+            known_benchmarks = self.load_all_benchmarks()
+        missing = [bid for bid in benchmark_ids if bid not in known_benchmarks]
         return len(missing) == 0, missing
 
     def add_benchmarks(self, input_data: dict, dry_run: bool = True) -> dict:
@@ -111,6 +208,9 @@ class DataManager:
         # Load existing benchmarks
         all_existing = self.load_all_benchmarks()
 
+        # Pending writes grouped by category file so each file is rewritten once
+        pending: Dict[Path, Dict[str, dict]] = defaultdict(dict)
+
         for bench_id, bench_data in benchmarks_to_add.items():
             category = bench_data.get('category', 'knowledge')
             category_file = self.benchmarks_dir / f'{category}.json'
@@ -127,33 +227,25 @@ class DataManager:
                 else:
                     results['updated'].append(f"{bench_id} (data differs)")
                     if not dry_run:
-                        self._update_benchmark(category_file, bench_id, bench_data)
+                        pending[category_file][bench_id] = bench_data
             else:
                 results['added'].append(bench_id)
                 if not dry_run:
-                    self._add_benchmark(category_file, bench_id, bench_data)
-
-        return results
-
-    def _add_benchmark(self, category_file: Path, bench_id: str, bench_data: dict):
-        """Add a benchmark to a category file."""
-        with open(category_file) as f:
-            data = json.load(f)
+                    pending[category_file][bench_id] = bench_data
 
-        data['benchmarks'][bench_id] = bench_data
+        for category_file, benchmarks in pending.items():
+            self._write_benchmarks(category_file, benchmarks)
 
-        with open(category_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        return results
 
-    def _update_benchmark(self, category_file: Path, bench_id: str, bench_data: dict):
-        """Update an existing benchmark."""
-        with open(category_file) as f:
-            data = json.load(f)
+    def _write_benchmarks(self, category_file: Path, benchmarks: Dict[str, dict]):
+        """Add or replace benchmarks in a category file with a single write."""
+        data = _read_json(category_file)
 
-        data['benchmarks'][bench_id] = bench_data
+        data['benchmarks'].update(benchmarks)
 
-        with open(category_file, 'w') as f:
-            json.dump(data, f, indent=2)
+        _write_json(category_file, data)
+        self._invalidate_caches()
 
     def add_models(self, input_data: dict, dry_run: bool = True) -> dict:
         """Add models to appropriate provider files."""
@@ -185,59 +277,85 @@ class DataManager:
             return results
 
         # Load existing file
-        with open(file_path) as f:
-            existing_data = json.load(f)
+        existing_data = _read_json(file_path)
 
-        existing_model_ids = {m['id'] for m in existing_data.get('models', [])}
+        # First entry wins for duplicated IDs, matching _model_index
+        existing_by_id = {}
+        for m in existing_data.get('models', []):
+            existing_by_id.setdefault(m['id'], m)
+        known_benchmarks = set(self.load_all_benchmarks().keys())
+        timestamp = datetime.now().isoformat()
+        changed = False  # something must be written
+        content_changed = False  # beyond the last_updated timestamp
 
         for model in models_to_add:
             model_id = model['id']
 
             # Validate benchmark references
-            benchmark_ids = set(model.get('benchmarks', {}).keys())
-            valid, missing = self.validate_benchmarks_exist(benchmark_ids)
+            valid, missing = self.validate_benchmarks_exist(
+                model.get('benchmarks', {}).keys(), known_benchmarks
+            )
             if not valid:
                 results['missing_benchmarks'].extend(
                     [f"{model_id}: {b}" for b in missing]
                 )
 
             # Check if model exists
-            if model_id in existing_model_ids:
-                # Find and compare
-                existing_model = next(m for m in existing_data['models'] if m['id'] == model_id)
+            existing_model = existing_by_id.get(model_id)
+            if existing_model is not None:
                 if existing_model == model:
                     results['skipped'].append(f"{model_id} (identical)")
                 else:
                     results['updated'].append(f"{model_id} (data differs)")
                     if not dry_run:
-                        self._update_model_in_file(file_path, existing_data, model_id, model)
+                        # update() replaces values rather than mutating them, so a shallow copy suffices
+                        before = dict(existing_model)
+                        self._update_model_in_file(existing_by_id, model_id, model)
+                        if existing_model != before:
+                            content_changed = True
+                        changed = True
             else:
                 results['added'].append(model_id)
                 if not dry_run:
-                    self._add_model_to_file(file_path, existing_data, model)
+                    self._add_model_to_file(existing_data, model)
+                    changed = content_changed = True
+
+        if content_changed:
+            self._save_model_file(file_path, existing_data, timestamp)
+        elif changed:
+            # Merges that left every model as it was only move the timestamp
+            self._touch_model_file(file_path, existing_data, timestamp)
 
         return results
 
-    def _add_model_to_file(self, file_path: Path, data: dict, model: dict):
-        """Add a model to a file."""
+    def _add_model_to_file(self, data: dict, model: dict):
+        """Add a model to a loaded provider file."""
         data['models'].append(model)
-        data['last_updated'] = datetime.now().isoformat()
-
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
 
-    def _update_model_in_file(self, file_path: Path, data: dict, model_id: str, new_model: dict):
-        """Update an existing model in a file by merging fields."""
-        for i, model in enumerate(data['models']):
-            if model['id'] == model_id:
-                # Merge new fields into existing model instead of replacing
-                data['models'][i].update(new_model)
-                break
-
-        data['last_updated'] = datetime.now().isoformat()
-
-        with open(file_path, 'w') as f:
-            json.dump(data, f, indent=2)
+    def _update_model_in_file(self, existing_by_id: Dict[str, dict], model_id: str, new_model: dict):
+        """Update an existing model in a loaded provider file by merging fields."""
+        # Index entries are the same objects as data['models'], so this merges in place
+        existing_by_id[model_id].update(new_model)
+
+    def _save_model_file(self, file_path: Path, data: dict, timestamp: str = None):
+        """Stamp and write a provider file once all of its changes are applied."""
+        data['last_updated'] = timestamp or datetime.now().isoformat()
+
+        _write_json(file_path, data)
+        self._invalidate_caches()
+
+    def _touch_model_file(self, file_path: Path, data: dict, timestamp: str):
+        """Update only last_updated, patching the bytes on disk when the length allows."""
+        new_value = timestamp.encode('utf-8')
+        with open(file_path, 'r+b') as f:
+            match = _LAST_UPDATED_RE.search(f.read())
+            if match and len(match.group(1)) == len(new_value):
+                f.seek(match.start(1))
+                f.write(new_value)
+                data['last_updated'] = timestamp
+                self._invalidate_caches()
+                return
+        self._save_model_file(file_path, data, timestamp)
 
     def validate_all(self) -> dict:
         """Validate entire dataset for consistency."""
@@ -252,16 +370,7 @@ class DataManager:
         all_models = self.load_all_models()
 
         # Check for duplicate benchmark IDs across categories
-        benchmark_counts = {}
-        for category_file in self.benchmarks_dir.glob('*.json'):
-            if category_file.name == 'categories.json':
-                continue
-            with open(category_file) as f:
-                data = json.load(f)
-                for bench_id in data.get('benchmarks', {}).keys():
-                    benchmark_counts[bench_id] = benchmark_counts.get(bench_id, 0) + 1
-
-        duplicates = [bid for bid, count in benchmark_counts.items() if count > 1]
+        duplicates = [bid for bid, files in self._benchmark_sources.items() if len(files) > 1]
         if duplicates:
             results['valid'] = False
             results['errors'].append(f"Duplicate benchmark IDs: {duplicates}")
@@ -271,7 +380,8 @@ class DataManager:
         for file_data in all_models.values():
             all_model_ids.extend([m['id'] for m in file_data.get('models', [])])
 
-        duplicate_models = [mid for mid in set(all_model_ids) if all_model_ids.count(mid) > 1]
+        model_counts = Counter(all_model_ids)
+        duplicate_models = [mid for mid, count in model_counts.items() if count > 1]
         if duplicate_models:
             results['valid'] = False
             results['errors'].append(f"Duplicate model IDs: {duplicate_models}")
@@ -290,41 +400,43 @@ class DataManager:
 
 def print_results(results: dict, operation: str):
     """Pretty print operation results."""
-    print(f"\n{'='*60}")
-    print(f"Results: {operation}")
-    print('='*60)
+    out = []
+    out.append(f"\n{'='*60}")
+    out.append(f"Results: {operation}")
+    out.append('='*60)
 
     if results.get('added'):
-        print(f"\n✅ Added ({len(results['added'])}):")
+        out.append(f"\n✅ Added ({len(results['added'])}):")
         for item in results['added']:
-            print(f"  + {item}")
+            out.append(f"  + {item}")
 
     if results.get('updated'):
-        print(f"\n🔄 Updated ({len(results['updated'])}):")
+        out.append(f"\n🔄 Updated ({len(results['updated'])}):")
         for item in results['updated']:
-            print(f"  ~ {item}")
+            out.append(f"  ~ {item}")
 
     if results.get('skipped'):
-        print(f"\n⏭️  Skipped ({len(results['skipped'])}):")
+        out.append(f"\n⏭️  Skipped ({len(results['skipped'])}):")
         for item in results['skipped']:
-            print(f"  = {item}")
+            out.append(f"  = {item}")
 
     if results.get('missing_benchmarks'):
-        print(f"\n⚠️  Missing benchmark references ({len(results['missing_benchmarks'])}):")
+        out.append(f"\n⚠️  Missing benchmark references ({len(results['missing_benchmarks'])}):")
         for item in results['missing_benchmarks']:
-            print(f"  ! {item}")
+            out.append(f"  ! {item}")
 
     if results.get('errors'):
-        print(f"\n❌ Errors ({len(results['errors'])}):")
+        out.append(f"\n❌ Errors ({len(results['errors'])}):")
         for error in results['errors']:
-            print(f"  ✗ {error}")
+            out.append(f"  ✗ {error}")
 
     if results.get('warnings'):
-        print(f"\n⚠️  Warnings ({len(results['warnings'])}):")
+        out.append(f"\n⚠️  Warnings ({len(results['warnings'])}):")
         for warning in results['warnings']:
-            print(f"  ! {warning}")
+            out.append(f"  ! {warning}")
 
-    print()
+    out.append('')
+    sys.stdout.write('\n'.join(out) + '\n')
 
 
 def main():
@@ -390,8 +502,7 @@ Input file format examples in CLAUDE.md
 
     # Execute command
     if args.command == 'add-benchmarks':
-        with open(args.input_file) as f:
-            input_data = json.load(f)
+        input_data = _read_json(args.input_file)
 
         if args.dry_run:
             print("\n🔍 DRY RUN MODE - No changes will be applied\n")
@@ -403,8 +514,7 @@ Input file format examples in CLAUDE.md
             print("💡 Run without --dry-run to apply these changes\n")
 
     elif args.command == 'add-models':
-        with open(args.input_file) as f:
-            input_data = json.load(f)
+        input_data = _read_json(args.input_file)
 
         if args.dry_run:
             print("\n🔍 DRY RUN MODE - No changes will be applied\n")
@@ -442,39 +552,41 @@ Input file format examples in CLAUDE.md
             print(f"\n❌ Model '{args.model_id}' not found\n")
             sys.exit(1)
 
-        print(f"\n{'='*60}")
-        print(f"Model: {result['model'].get('name', result['model']['id'])}")
-        print('='*60)
-        print(f"\nID: {result['model']['id']}")
-        print(f"Provider: {result['provider']}")
-        print(f"Family: {result['model'].get('family', 'N/A')}")
-        print(f"File: {result['file']}")
+        out = []
+        out.append(f"\n{'='*60}")
+        out.append(f"Model: {result['model'].get('name', result['model']['id'])}")
+        out.append('='*60)
+        out.append(f"\nID: {result['model']['id']}")
+        out.append(f"Provider: {result['provider']}")
+        out.append(f"Family: {result['model'].get('family', 'N/A')}")
+        out.append(f"File: {result['file']}")
 
         if result['model'].get('parameters_billions'):
-            print(f"\nTotal Parameters: {result['model']['parameters_billions']}B")
+            out.append(f"\nTotal Parameters: {result['model']['parameters_billions']}B")
         if result['model'].get('active_parameters_billions'):
-            print(f"Active Parameters: {result['model']['active_parameters_billions']}B")
+            out.append(f"Active Parameters: {result['model']['active_parameters_billions']}B")
 
         if result['model'].get('parameters_source'):
             src = result['model']['parameters_source']
-            print(f"\nParameter Source:")
-            print(f"  Type: {src.get('type', 'N/A')}")
-            print(f"  URL: {src.get('url', 'N/A')}")
+            out.append(f"\nParameter Source:")
+            out.append(f"  Type: {src.get('type', 'N/A')}")
+            out.append(f"  URL: {src.get('url', 'N/A')}")
             if src.get('notes'):
-                print(f"  Notes: {src['notes']}")
+                out.append(f"  Notes: {src['notes']}")
 
         if result['model'].get('pricing'):
             pricing = result['model']['pricing']
-            print(f"\nPricing:")
-            print(f"  Input: ${pricing['input_per_1m_tokens']:.2f} per 1M tokens")
-            print(f"  Output: ${pricing['output_per_1m_tokens']:.2f} per 1M tokens")
+            out.append(f"\nPricing:")
+            out.append(f"  Input: ${pricing['input_per_1m_tokens']:.2f} per 1M tokens")
+            out.append(f"  Output: ${pricing['output_per_1m_tokens']:.2f} per 1M tokens")
 
         if result['model'].get('benchmarks'):
-            print(f"\nBenchmarks ({len(result['model']['benchmarks'])}):")
+            out.append(f"\nBenchmarks ({len(result['model']['benchmarks'])}):")
             for bench_id, bench_data in sorted(result['model']['benchmarks'].items()):
-                print(f"  {bench_id}: {bench_data.get('score', 'N/A')}")
+                out.append(f"  {bench_id}: {bench_data.get('score', 'N/A')}")
 
-        print()
+        out.append('')
+        sys.stdout.write('\n'.join(out) + '\n')
 
     elif args.command == 'list':
         models = manager.list_models(
@@ -486,27 +598,29 @@ Input file format examples in CLAUDE.md
             print("\n❌ No models found matching criteria\n")
             sys.exit(1)
 
-        print(f"\n{'='*60}")
-        print(f"Models ({len(models)})")
-        print('='*60)
-        print()
+        out = []
+        out.append(f"\n{'='*60}")
+        out.append(f"Models ({len(models)})")
+        out.append('='*60)
+        out.append('')
 
         # Group by provider
         current_provider = None
         for model in models:
-            if model['provider'] != current_provider:
-                current_provider = model['provider']
-                print(f"\n{current_provider}:")
+            if model.provider != current_provider:
+                current_provider = model.provider
+                out.append(f"\n{current_provider}:")
 
             params_str = ""
-            if model['active_parameters_billions'] and model['parameters_billions']:
-                params_str = f" ({model['active_parameters_billions']}B / {model['parameters_billions']}B)"
-            elif model['parameters_billions']:
-                params_str = f" ({model['parameters_billions']}B)"
+            if model.active_parameters_billions and model.parameters_billions:
+                params_str = f" ({model.active_parameters_billions}B / {model.parameters_billions}B)"
+            elif model.parameters_billions:
+                params_str = f" ({model.parameters_billions}B)"
 
-            print(f"  {model['id']}: {model['name']}{params_str}")
+            out.append(f"  {model.id}: {model.name}{params_str}")
 
-        print()
+        out.append('')
+        sys.stdout.write('\n'.join(out) + '\n')
 
 
 if __name__ == '__main__':
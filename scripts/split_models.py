@@ -4,6 +4,7 @@ Rebuild manifest.json from provider model files.
 """
 
 import json
+import os
 from pathlib import Path
 from datetime import datetime
 
@@ -13,11 +14,37 @@ models_dir = data_dir / "models"
 if not models_dir.exists():
     raise SystemExit(f"Models directory not found: {models_dir}")
 
-# Gather all provider files
-provider_files = []
-for path in sorted(models_dir.rglob("*.json")):
-    if path.is_file():
-        provider_files.append(str(path.relative_to(data_dir)))
+
+def walk_json_files(directory):
+    """Yield .json file paths under directory, relative to data_dir."""
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from walk_json_files(entry.path)
+            elif entry.name.endswith(".json") and entry.is_file(follow_symlinks=False):
+                yield os.path.relpath(entry.path, data_dir)
+
+
+# Gather all provider files, sorted by path component (qwen/*.json before qwen.json)
+provider_files = sorted(walk_json_files(models_dir), key=lambda p: p.split(os.sep))
+
+manifest_path = data_dir / "manifest.json"
+
+# Leave manifest.json alone when the file list is unchanged and no model file
+# was modified since it was written; otherwise last_updated must move forward
+if manifest_path.exists():
+    try:
+        with open(manifest_path) as f:
+            existing_files = json.load(f).get("model_files")
+    except (ValueError, AttributeError):
+        existing_files = None  # empty or malformed manifest: rebuild it
+    newest_model_mtime = max(
+        (os.stat(data_dir / path).st_mtime_ns for path in provider_files), default=0
+    )
+    if (existing_files == provider_files
+            and newest_model_mtime <= manifest_path.stat().st_mtime_ns):
+        print(f"✓ manifest.json already up to date ({len(provider_files)} provider files)")
+        raise SystemExit(0)
 
 # Create manifest.json
 manifest = {
@@ -25,7 +52,6 @@ manifest = {
     "last_updated": datetime.now().isoformat()
 }
 
-manifest_path = data_dir / "manifest.json"
 with open(manifest_path, "w") as f:
     json.dump(manifest, f, indent=2)
 
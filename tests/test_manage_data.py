@@ -0,0 +1,177 @@
+import json
+from datetime import datetime
+
+import pytest
+
+import manage_data
+from manage_data import DataManager
+
+
+FIXED_NOW = datetime(2026, 10, 15, 12, 0, 0, 123456)
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return FIXED_NOW
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """Minimal dataset: one benchmark category and one provider file."""
+    monkeypatch.setattr(manage_data, 'datetime', FixedDatetime)
+
+    (tmp_path / 'benchmarks').mkdir()
+    (tmp_path / 'models').mkdir()
+    (tmp_path / 'benchmarks' / 'coding.json').write_text(json.dumps({
+        'category': 'coding',
+        'benchmarks': {
+            'humaneval': {'name': 'HumanEval', 'category': 'coding'}
+        }
+    }, indent=2))
+    return tmp_path
+
+
+def write_provider_file(data_dir, last_updated):
+    # Trailing newline marks the file as not rewritten by json.dump
+    path = data_dir / 'models' / 'acme.json'
+    path.write_text(json.dumps({
+        'provider': 'Acme',
+        'models': [
+            {'id': 'acme-1', 'name': 'Acme 1', 'provider': 'Acme', 'family': 'Acme'}
+        ],
+        'last_updated': last_updated
+    }, indent=2) + '\n')
+    return path
+
+
+def test_noop_merge_patches_timestamp_in_place(data_dir):
+    path = write_provider_file(data_dir, '2026-01-01T10:40:51.453812')
+    before = path.read_text()
+
+    # A partial update whose fields already match leaves the model unchanged
+    results = DataManager(data_dir).add_models(
+        {'provider': 'Acme', 'models': [{'id': 'acme-1', 'name': 'Acme 1'}]},
+        dry_run=False
+    )
+
+    assert results['updated'] == ['acme-1 (data differs)']
+    assert path.read_text() == before.replace(
+        '2026-01-01T10:40:51.453812', FIXED_NOW.isoformat()
+    )
+
+
+def test_noop_merge_falls_back_to_full_save_on_length_mismatch(data_dir):
+    path = write_provider_file(data_dir, '2026-01-01')
+
+    DataManager(data_dir).add_models(
+        {'provider': 'Acme', 'models': [{'id': 'acme-1', 'name': 'Acme 1'}]},
+        dry_run=False
+    )
+
+    text = path.read_text()
+    assert not text.endswith('\n')
+    assert json.loads(text)['last_updated'] == FIXED_NOW.isoformat()
+
+
+def test_writes_invalidate_cached_data(data_dir):
+    write_provider_file(data_dir, '2026-01-01T10:40:51.453812')
+    manager = DataManager(data_dir)
+
+    assert 'new_bench' not in manager.load_all_benchmarks()
+    assert manager.query_model('acme-2') is None
+
+    manager.add_benchmarks(
+        {'benchmarks': {'new_bench': {'name': 'New', 'category': 'coding'}}},
+        dry_run=False
+    )
+    manager.add_models(
+        {'provider': 'Acme', 'models': [{'id': 'acme-2', 'name': 'Acme 2'}]},
+        dry_run=False
+    )
+
+    assert 'new_bench' in manager.load_all_benchmarks()
+    assert manager.query_model('acme-2')['file'] == 'models/acme.json'
+
+
+def test_duplicate_ids_compare_against_first_entry(data_dir):
+    path = data_dir / 'models' / 'acme.json'
+    path.write_text(json.dumps({
+        'provider': 'Acme',
+        'models': [{'id': 'a', 'name': 'first'}, {'id': 'a', 'name': 'second'}]
+    }, indent=2))
+    manager = DataManager(data_dir)
+
+    results = manager.add_models(
+        {'provider': 'Acme', 'models': [{'id': 'a', 'name': 'first'}]}, dry_run=False
+    )
+    assert results['skipped'] == ['a (identical)']
+
+    manager.add_models(
+        {'provider': 'Acme', 'models': [{'id': 'a', 'name': 'updated'}]}, dry_run=False
+    )
+    names = [m['name'] for m in json.loads(path.read_text())['models']]
+    assert names == ['updated', 'second']
+    assert manager.query_model('a')['model']['name'] == 'updated'
+
+
+def test_add_benchmarks_writes_each_category_file_once(data_dir, monkeypatch):
+    writes = []
+    real_write = manage_data._write_json
+    monkeypatch.setattr(
+        manage_data, '_write_json', lambda path, data: (writes.append(path), real_write(path, data))
+    )
+
+    results = DataManager(data_dir).add_benchmarks({'benchmarks': {
+        'new_a': {'name': 'A', 'category': 'coding'},
+        'new_b': {'name': 'B', 'category': 'coding'},
+        'humaneval': {'name': 'HumanEval v2', 'category': 'coding'},
+    }}, dry_run=False)
+
+    assert results['added'] == ['new_a', 'new_b']
+    assert results['updated'] == ['humaneval (data differs)']
+    assert writes == [data_dir / 'benchmarks' / 'coding.json']
+    saved = json.loads(writes[0].read_text())['benchmarks']
+    assert set(saved) == {'humaneval', 'new_a', 'new_b'}
+    assert saved['humaneval']['name'] == 'HumanEval v2'
+
+
+def test_equal_numbers_with_different_types_are_identical(data_dir):
+    path = data_dir / 'models' / 'acme.json'
+    path.write_text(json.dumps({
+        'provider': 'Acme',
+        'models': [{'id': 'acme-1', 'benchmarks': {'humaneval': {'score': 73.0}}}]
+    }, indent=2))
+    before = path.read_text()
+
+    results = DataManager(data_dir).add_models({'provider': 'Acme', 'models': [
+        {'id': 'acme-1', 'benchmarks': {'humaneval': {'score': 73}}}
+    ]}, dry_run=False)
+
+    assert results['skipped'] == ['acme-1 (identical)']
+    assert path.read_text() == before
+
+
+def test_repeated_id_in_input_compares_against_merged_model(data_dir):
+    path = write_provider_file(data_dir, '2026-01-01T10:40:51.453812')
+    original = json.loads(path.read_text())['models'][0]
+    changed = dict(original, name='Changed')
+
+    results = DataManager(data_dir).add_models(
+        {'provider': 'Acme', 'models': [changed, original]}, dry_run=False
+    )
+
+    assert results['updated'] == ['acme-1 (data differs)', 'acme-1 (data differs)']
+    assert json.loads(path.read_text())['models'] == [original]
+
+
+def test_validate_reports_benchmarks_defined_in_two_categories(data_dir):
+    (data_dir / 'benchmarks' / 'math.json').write_text(json.dumps({
+        'category': 'math',
+        'benchmarks': {'humaneval': {'name': 'HumanEval', 'category': 'math'}}
+    }, indent=2))
+
+    results = DataManager(data_dir).validate_all()
+
+    assert not results['valid']
+    assert results['errors'] == ["Duplicate benchmark IDs: ['humaneval']"]